@@ -4,6 +4,6 @@ FENDL_vis - Library for loading and visualizing ENDF data from FENDL.
 
 __version__ = "0.1.0"
 
-from .loader import EndfLoader
+from .loader import EndfLoader, EvaluationSummary, LazyMaterial
 from .plotter import EndfPlotter
 from .gui import EndfGui, run_gui 
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Description tables for ENDF MF and MT numbers.
+"""
+
+# Descriptions of ENDF MF (file) numbers
+MF_DESCRIPTIONS = {
+    1: "General Information",
+    2: "Resonance Parameters",
+    3: "Cross Sections",
+    4: "Angular Distributions",
+    5: "Energy Distributions",
+    6: "Energy-Angle Distributions",
+    7: "Thermal Scattering Data",
+    8: "Radioactivity and Fission-Product Yields",
+    9: "Multiplicities",
+    10: "Cross Sections for Production of Radioactive Nuclides",
+    12: "Multiplicities and Transition Probability Arrays",
+    13: "Photon Production Cross Sections",
+    14: "Photon Angular Distributions",
+    15: "Continuous Photon Energy Spectra",
+    23: "Smooth Photon Interaction Cross Sections",
+    27: "Atomic Form Factors"
+}
+
+# Descriptions of common MT (reaction) numbers
+MT_DESCRIPTIONS = {
+    1: "Total cross section",
+    2: "Elastic scattering",
+    3: "Nonelastic cross section",
+    4: "Inelastic cross section",
+    5: "Sum of all reactions not given explicitly",
+    16: "(n,2n)",
+    17: "(n,3n)",
+    18: "Fission",
+    51: "Inelastic scattering to 1st excited state",
+    102: "Radiative capture (n,gamma)",
+    103: "(n,p)",
+    104: "(n,d)",
+    105: "(n,t)",
+    451: "File information and dictionary"
+}
+
+# Pre-formatted descriptions of every tabulated MF, MT pair
+_SECTION_DESCRIPTIONS = {
+    (mf, mt): f"{mf_desc} - {mt_desc}"
+    for mf, mf_desc in MF_DESCRIPTIONS.items()
+    for mt, mt_desc in MT_DESCRIPTIONS.items()
+}
+_SECTION_DESCRIPTIONS[1, 451] = "General information"
+
+
+def describe_mf(mf):
+    """
+    Get description for an MF number.
+    
+    Args:
+        mf (int): The MF number.
+        
+    Returns:
+        str: Description of the MF file.
+    """
+    return MF_DESCRIPTIONS.get(mf, f"File {mf}")
+
+
+def describe_mt(mt):
+    """
+    Get description for an MT number.
+    
+    Args:
+        mt (int): The MT number.
+        
+    Returns:
+        str: Description of the MT reaction.
+    """
+    return MT_DESCRIPTIONS.get(mt, f"MT={mt}")
+
+
+def describe_section(mf, mt):
+    """
+    Get description for an MF, MT section.
+    
+    Args:
+        mf (int): The MF (file) number.
+        mt (int): The MT (section) number.
+        
+    Returns:
+        str: Description of the section.
+    """
+    description = _SECTION_DESCRIPTIONS.get((mf, mt))
+    if description is None:
+        description = f"{describe_mf(mf)} - {describe_mt(mt)}"
+    return description
@@ -2,18 +2,75 @@
 Simple GUI for browsing and plotting ENDF data.
 """
 
+import os
+import sys
+import hashlib
+import pickle
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox, scrolledtext
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
+from endf import Tabulated1D
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
+from .endf_tables import MF_DESCRIPTIONS, MT_DESCRIPTIONS, describe_mf, describe_mt
 from .loader import EndfLoader
 from .plotter import EndfPlotter
 
 
+# Pre-formatted "number: description" combobox labels for the known numbers
+_MF_LABELS = {mf: f"{mf}: {desc}" for mf, desc in MF_DESCRIPTIONS.items()}
+_MT_LABELS = {mt: f"{mt}: {desc}" for mt, desc in MT_DESCRIPTIONS.items()}
+
+# Number of parsed materials kept in memory for instant revisits
+_MATERIAL_CACHE_SIZE = 8
+
+# Number of speculative loads of neighbouring files tracked at once
+_PREFETCH_SIZE = 4
+
+# Number of extracted (x, y, xlabel, ylabel) plot inputs kept for replotting
+_PLOT_DATA_CACHE_SIZE = 32
+
+# Directory for pickled materials reused across sessions
+_DISK_CACHE_DIR = Path.home() / ".cache" / "fendl_vis"
+
+# Bumped when pickled materials change meaning, so older entries are not reused
+_DISK_CACHE_VERSION = 2
+
+# Number of pickled materials kept on disk; the least recently used are deleted
+_DISK_CACHE_SIZE = 64
+
+# Quiet period before acting on list/combobox selections, in milliseconds
+_SELECT_DEBOUNCE_MS = 150
+
+# Optional MF=3 reactions added to comparisons: n,2n - fission - n,p - n,d - n,t
+_COMPARE_CANDIDATES = frozenset({16, 18, 103, 104, 105})
+
+# Curves longer than this are decimated to a few points per pixel column of the axes
+_DECIMATE_THRESHOLD = 5000
+_DECIMATE_POINTS_PER_PIXEL = 2
+
+# NumPy formatter matching the per-value "{:.6e}" style of array samples
+_SAMPLE_FORMATTER = {'float_kind': lambda x: f"{x:.6e}"}
+
+# Section keys tried, in order of preference, for generic x/y plot data
+_X_KEYS = ('E', 'energy', 'x')
+_Y_KEYS = ('sigma', 'data', 'y')
+
+
+def _first_array_key(section_data, candidates):
+    """Get the first candidate key whose section value is a list or array."""
+    present = section_data.keys() & frozenset(candidates)
+    for key in sorted(present, key=candidates.index):
+        if isinstance(section_data[key], (list, np.ndarray)):
+            return key
+    return None
+
+
 class EndfGui:
     """Simple GUI for browsing and plotting ENDF data."""
     
@@ -27,11 +84,55 @@ class EndfGui:
         self.data_dir = Path(data_dir)
         self.loader = EndfLoader(self.data_dir)
         self.material = None
+        self._material_key = None
+        self._mf_to_mts = {}
+        self._mf_values = []
+        self._mf_labels = []
+        self._mt_labels = {}
+        self._common_mt = []
+        self._comparison_sections = []
         self.current_plot = None
+        self._axes_key = None
+        self._last_plot_key = None
+        self._decimated_line = None
         self.text_widget = None
         
+        # Worker pool for parsing ENDF files off the Tk main thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._load_future = None
+        self._load_request_id = 0
+        self._plot_request_id = 0
+        
+        # Pending debounced selection callbacks (Tk "after" ids)
+        self._pending_file_select = None
+        self._pending_mf_select = None
+        
+        # Whether a replot for a plot option change is already queued
+        self._replot_pending = False
+        
+        # Parsed materials keyed by (path, mtime_ns), least recently used first
+        self._material_cache = OrderedDict()
+        
+        # Speculative loads of the next file in the list, keyed like the material cache
+        self._prefetch = OrderedDict()
+        
+        # Plot inputs keyed by (material cache key, MF, MT), least recently used first
+        self._plot_data_cache = OrderedDict()
+        
+        # Directory listings keyed by directory, stored with the directory mtime_ns
+        self._dir_list_cache = {}
+        
         self._create_widgets()
         self._load_file_list()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _on_close(self):
+        """Shut down background workers and close the window."""
+        for future in self._prefetch.values():
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
     
     def _create_widgets(self):
         """Create the GUI widgets."""
@@ -84,7 +185,8 @@ class EndfGui:
         self.log_scale_check = ttk.Checkbutton(
             self.options_frame, 
             text="Logarithmic Scale", 
-            variable=self.log_scale_var
+            variable=self.log_scale_var,
+            command=self._schedule_replot
         )
         self.log_scale_check.pack(anchor=tk.W, padx=5, pady=5)
         
@@ -93,7 +195,8 @@ class EndfGui:
         self.compare_check = ttk.Checkbutton(
             self.options_frame,
             text="Compare Common Cross Sections",
-            variable=self.compare_var
+            variable=self.compare_var,
+            command=self._schedule_replot
         )
         self.compare_check.pack(anchor=tk.W, padx=5, pady=5)
         
@@ -125,8 +228,15 @@ class EndfGui:
         self.display_container = ttk.Frame(self.right_panel)
         self.display_container.pack(fill=tk.BOTH, expand=True)
         
-        # Initial empty figure
-        self.fig, self.ax = plt.subplots(figsize=(6, 4))
+        # Frame holding the canvas and toolbar, hidden while text is displayed
+        self.plot_frame = ttk.Frame(self.display_container)
+        self.plot_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Initial empty figure (reused for every plot). It is created directly
+        # rather than through pyplot so it is never registered with pyplot's
+        # global figure manager.
+        self.fig = Figure(figsize=(6, 4))
+        self.ax = self.fig.add_subplot(111)
         self.ax.set_xlabel('Energy (eV)')
         self.ax.set_ylabel('Cross Section (barns)')
         self.ax.text(0.5, 0.5, 'Select a file and section to plot', 
@@ -134,12 +244,12 @@ class EndfGui:
         self.ax.grid(True)
         
         # Canvas for the plot
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.display_container)
-        self.canvas.draw()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Navigation toolbar
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.display_container)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.plot_frame)
         self.toolbar.update()
         
         # Flag for display type
@@ -148,10 +258,12 @@ class EndfGui:
     def _load_file_list(self):
         """Load the list of ENDF files from the data directory."""
         try:
-            self.endf_files = self.loader.list_files()
+            self.endf_files = self._list_endf_files()
             self.file_list.delete(0, tk.END)
-            for i, file in enumerate(self.endf_files):
-                self.file_list.insert(i, file.name)
+            
+            # Insert all names in a single Tcl call rather than one per file
+            if self.endf_files:
+                self.file_list.insert(tk.END, *(file.name for file in self.endf_files))
             
             if self.endf_files:
                 self.status_var.set(f"Found {len(self.endf_files)} ENDF files in {self.data_dir}")
@@ -161,6 +273,18 @@ class EndfGui:
             messagebox.showerror("Error", f"Error loading file list: {e}")
             self.status_var.set("Error loading file list")
     
+    def _list_endf_files(self):
+        """List ENDF files in the data directory, reusing the listing if unchanged."""
+        # Adding, removing or renaming entries updates the directory mtime
+        dir_mtime = self.data_dir.stat().st_mtime_ns
+        cached = self._dir_list_cache.get(self.data_dir)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+        
+        endf_files = self.loader.list_files()
+        self._dir_list_cache[self.data_dir] = (dir_mtime, endf_files)
+        return endf_files
+    
     def _browse_file(self):
         """Browse for an ENDF file."""
         filename = filedialog.askopenfilename(
@@ -186,81 +310,370 @@ class EndfGui:
                 messagebox.showerror("Error", f"Error loading file: {e}")
     
     def _on_file_select(self, event):
-        """Handle file selection."""
+        """Handle file selection once the selection has settled."""
+        if self._pending_file_select is not None:
+            self.root.after_cancel(self._pending_file_select)
+        
         selection = self.file_list.curselection()
+        self._pending_file_select = self.root.after(
+            _SELECT_DEBOUNCE_MS, self._do_file_select, selection
+        )
+    
+    def _do_file_select(self, selection):
+        """Load the selected file."""
+        self._pending_file_select = None
         if not selection:
             return
         
         index = selection[0]
         selected_file = self.endf_files[index]
         
+        # Drop a queued load that has not started yet; a running one is
+        # left to finish and its result ignored
+        if self._load_future is not None:
+            self._load_future.cancel()
+        self._load_request_id += 1
+        request_id = self._load_request_id
+        
+        # Reuse the parsed material if the file has not changed since
+        cache_key = self._material_cache_key(selected_file)
+        if cache_key in self._material_cache:
+            self._material_cache.move_to_end(cache_key)
+            self._show_material(self._material_cache[cache_key], selected_file, cache_key)
+            return
+        
+        # The status is painted on the next idle cycle while the worker parses
+        self.status_var.set(f"Loading {selected_file.name}...")
+        
+        # Take over a speculative load of this file, or parse it in a worker
+        # thread, and hand the result back to the main loop
+        self._load_future = self._prefetch.pop(cache_key, None)
+        if self._load_future is None or self._load_future.cancelled():
+            self._load_future = self._executor.submit(self._load_material, selected_file)
+        self._load_future.add_done_callback(
+            lambda future: self.root.after(
+                0, self._on_file_loaded, future, selected_file, cache_key, request_id
+            )
+        )
+    
+    def _material_cache_key(self, file_path):
+        """Get the in-memory cache key for a file, or None if it cannot be read."""
         try:
-            self.status_var.set(f"Loading {selected_file.name}...")
-            self.root.update_idletasks()  # Force update to show status
+            return (str(file_path), file_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _load_material(self, file_path):
+        """Load a material from the disk cache, indexing and caching it on a miss."""
+        material = self._try_load_cached(file_path)
+        if material is None:
+            # Sections are parsed on first access when a section is plotted
+            material = self.loader.load_file_lazy(file_path)
+            self._save_cached(file_path, material)
+        return material
+    
+    def _disk_cache_path(self, file_path):
+        """Get the pickle path for a file, keyed by the cache version and its path, size and mtime."""
+        stat = file_path.stat()
+        key = f"{_DISK_CACHE_VERSION}:{file_path}{stat.st_size}{stat.st_mtime_ns}"
+        return _DISK_CACHE_DIR / f"{hashlib.blake2b(key.encode()).hexdigest()}.pkl"
+    
+    def _try_load_cached(self, file_path):
+        """Load a previously pickled material, or None if no usable entry exists."""
+        try:
+            cache_path = self._disk_cache_path(file_path)
+            with open(cache_path, 'rb') as f:
+                material = pickle.load(f)
+        except Exception:
+            # Missing and corrupt entries alike are indexed again and rewritten
+            return None
+        
+        # Mark the entry as recently used so pruning keeps it
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return material
+    
+    def _save_cached(self, file_path, material):
+        """Pickle a parsed material to the disk cache, ignoring any failure."""
+        try:
+            data = pickle.dumps(material, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PickleError, TypeError, AttributeError):
+            return
+        
+        try:
+            cache_path = self._disk_cache_path(file_path)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.material = self.loader.load_file(selected_file)
-            self._update_section_combos()
-            self.status_var.set(f"Loaded {selected_file.name}")
-            self.plot_button.config(state=tk.NORMAL)
+            # Write to a temporary file first so readers never see a partial pickle
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            return
+        
+        self._prune_disk_cache()
+    
+    def _prune_disk_cache(self):
+        """Delete the least recently used pickles beyond the disk cache size."""
+        entries = []
+        try:
+            with os.scandir(_DISK_CACHE_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith('.pkl'):
+                        try:
+                            entries.append((entry.stat().st_mtime_ns, entry.path))
+                        except OSError:
+                            pass
+        except OSError:
+            return
+        
+        entries.sort()
+        for _, path in entries[:-_DISK_CACHE_SIZE]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _on_file_loaded(self, future, selected_file, cache_key, request_id):
+        """Apply the result of a background file load on the main thread."""
+        # Keep every successful parse, even one that has been superseded
+        self._cache_material(future, cache_key)
+        
+        # Ignore loads for selections that have since been superseded
+        if request_id != self._load_request_id:
+            return
+        
+        try:
+            self._show_material(future.result(), selected_file, cache_key)
         except Exception as e:
             messagebox.showerror("Error", f"Error loading file: {e}")
             self.status_var.set(f"Error loading {selected_file.name}")
     
+    def _cache_material(self, future, cache_key):
+        """Store the material from a finished background load in the in-memory cache."""
+        if cache_key is not None and not future.cancelled() and future.exception() is None:
+            self._material_cache[cache_key] = future.result()
+            if len(self._material_cache) > _MATERIAL_CACHE_SIZE:
+                self._material_cache.popitem(last=False)
+    
+    def _prefetch_neighbours(self, selected_file):
+        """Start loading the files either side of the selected one while the user looks at it."""
+        try:
+            index = self.endf_files.index(selected_file)
+        except ValueError:
+            return
+        for neighbour in (index + 1, index - 1):
+            if 0 <= neighbour < len(self.endf_files):
+                self._prefetch_file(self.endf_files[neighbour])
+    
+    def _prefetch_file(self, file_path):
+        """Load a file in the background so selecting it later is a cache hit."""
+        cache_key = self._material_cache_key(file_path)
+        if cache_key is None or cache_key in self._material_cache or cache_key in self._prefetch:
+            return
+        
+        future = self._executor.submit(self._load_material, file_path)
+        self._prefetch[cache_key] = future
+        if len(self._prefetch) > _PREFETCH_SIZE:
+            self._prefetch.popitem(last=False)[1].cancel()
+        future.add_done_callback(
+            lambda future: self.root.after(0, self._on_prefetched, future, cache_key)
+        )
+    
+    def _on_prefetched(self, future, cache_key):
+        """Move a finished speculative load into the in-memory cache."""
+        if self._prefetch.get(cache_key) is future:
+            del self._prefetch[cache_key]
+        self._cache_material(future, cache_key)
+    
+    def _show_material(self, material, selected_file, cache_key):
+        """Make a loaded material current and refresh the section selection."""
+        self.material = material
+        self._material_key = cache_key
+        self._index_sections()
+        self._update_section_combos()
+        self.status_var.set(f"Loaded {selected_file.name}")
+        self.plot_button.config(state=tk.NORMAL)
+        
+        # Users usually step through the list, so warm up the files next to this one
+        self._prefetch_neighbours(selected_file)
+    
+    def _index_sections(self):
+        """Build the MF -> sorted MT list index and combobox labels for the current material."""
+        # One sort of the (MF, MT) keys leaves both the MFs and each MT list in order
+        self._mf_to_mts = {}
+        for mf, mt in self.loader.sorted_keys(self.material):
+            self._mf_to_mts.setdefault(mf, []).append(mt)
+        
+        # MF numbers in combobox order, looked up by the selected position
+        self._mf_values = list(self._mf_to_mts)
+        
+        # Render the combobox labels once so MF changes only swap lists
+        self._mf_labels = [
+            _MF_LABELS.get(mf) or f"{mf}: {self._get_mf_description(mf)}"
+            for mf in self._mf_to_mts
+        ]
+        self._mt_labels = {
+            mf: [_MT_LABELS.get(mt) or f"{mt}: {self._get_mt_description(mt)}" for mt in mt_values]
+            for mf, mt_values in self._mf_to_mts.items()
+        }
+        
+        # Common important cross sections to compare (total, elastic,
+        # capture), plus any others that are available in the material
+        mf3_mts = self._mf_to_mts.get(3, [])
+        self._common_mt = [1, 2, 102] + [mt for mt in mf3_mts if mt in _COMPARE_CANDIDATES]
+        self._comparison_sections = [(3, mt) for mt in self._common_mt if mt in mf3_mts]
+    
     def _update_section_combos(self):
         """Update the MF and MT comboboxes based on the loaded material."""
         if not self.material:
             return
         
-        # Get unique MF values
-        mf_values = sorted(set(mf for mf, mt in self.material.section_data.keys()))
-        mf_labels = [f"{mf}: {self._get_mf_description(mf)}" for mf in mf_values]
-        
-        self.mf_combo['values'] = mf_labels
+        self.mf_combo['values'] = self._mf_labels
         self.mf_combo.current(0)  # Select first MF
         
         # Update MT values for selected MF
-        self._on_mf_select(None)
+        self._do_mf_select()
     
     def _on_mf_select(self, event):
-        """Handle MF selection."""
-        if not self.material or not self.mf_combo.get():
+        """Handle MF selection once the selection has settled."""
+        if self._pending_mf_select is not None:
+            self.root.after_cancel(self._pending_mf_select)
+        
+        self._pending_mf_select = self.root.after(_SELECT_DEBOUNCE_MS, self._do_mf_select)
+    
+    def _do_mf_select(self):
+        """Update the MT combobox for the selected MF."""
+        self._pending_mf_select = None
+        if not self.material or self.mf_combo.current() < 0:
             return
         
         # Get the selected MF value
-        selected_mf = int(self.mf_combo.get().split(':')[0])
-        
-        # Get all MT values for the selected MF
-        mt_values = sorted(mt for mf, mt in self.material.section_data.keys() if mf == selected_mf)
-        mt_labels = [f"{mt}: {self._get_mt_description(mt)}" for mt in mt_values]
+        selected_mf = self._mf_values[self.mf_combo.current()]
         
-        self.mt_combo['values'] = mt_labels
+        # Show the pre-rendered MT labels for the selected MF
+        self.mt_combo['values'] = self._mt_labels[selected_mf]
         self.mt_combo.current(0)  # Select first MT
     
+    def _schedule_replot(self):
+        """Queue a single replot for plot option changes, once the event loop is idle."""
+        if not self._replot_pending:
+            self._replot_pending = True
+            self.root.after_idle(self._do_replot)
+    
+    def _do_replot(self):
+        """Replot with the current options if something has been plotted already."""
+        self._replot_pending = False
+        if self._last_plot_key is not None:
+            self._plot_section()
+    
     def _plot_section(self):
         """Plot the selected section."""
         if not self.material:
             return
         
+        # Apply an MF change that is still waiting out the debounce
+        if self._pending_mf_select is not None:
+            self.root.after_cancel(self._pending_mf_select)
+            self._do_mf_select()
+        
+        # Get selected MF and MT; the MT combobox lists the MF's sorted MT numbers
+        compare = self.compare_var.get()
+        selected_mf = self._mf_values[self.mf_combo.current()]
+        selected_mt = self._mf_to_mts[selected_mf][self.mt_combo.current()]
+        
+        # Skip requests for exactly what is already displayed; the comparison
+        # does not depend on the selected section
+        section = None if compare else (selected_mf, selected_mt)
+        plot_key = (self._material_key, section, self.log_scale_var.get())
+        if self._material_key is not None and plot_key == self._last_plot_key:
+            return
+        
+        # Only the scale option differs from what the axes show, so restyle
+        # the existing lines instead of reading and replotting the data; a
+        # read still running for another request must not draw over them
+        if self._material_key is not None and self._axes_key == (self._material_key, section):
+            self._cancel_pending_plot()
+            self._last_plot_key = plot_key
+            self._rescale_plot()
+            return
+        
+        # Check if compare mode is enabled
+        if compare:
+            self._last_plot_key = plot_key
+            self._plot_comparison()
+            return
+        
+        # Check the section exists before parsing it
+        if (selected_mf, selected_mt) not in self.material.section_data:
+            messagebox.showerror("Error", f"Section (MF={selected_mf}, MT={selected_mt}) not found")
+            return
+        
+        self._last_plot_key = plot_key
+        self.status_var.set(f"Reading section (MF={selected_mf}, MT={selected_mt})...")
+        self._parse_in_background(
+            [(selected_mf, selected_mt)],
+            lambda parsed: self._show_section(parsed[0], selected_mf, selected_mt)
+        )
+    
+    def _rescale_plot(self):
+        """Switch the displayed plot between log and linear axes without replotting it."""
+        log_scale = self.log_scale_var.get()
+        EndfPlotter.apply_scale(self.ax, log_scale)
+        self._redecimate(self.ax)
+        
+        # Redraw the persistent canvas and reset the toolbar's view history
+        self.canvas.draw_idle()
+        self.toolbar.update()
+        
+        self.status_var.set(f"Switched to {'logarithmic' if log_scale else 'linear'} scale")
+    
+    def _cancel_pending_plot(self):
+        """Drop the result of any section read still in flight and return the new request id."""
+        self._plot_request_id += 1
+        return self._plot_request_id
+    
+    def _parse_in_background(self, sections, on_parsed):
+        """Parse sections of the current material in a worker thread, then call on_parsed with them."""
+        # Newer plot requests supersede this one
+        request_id = self._cancel_pending_plot()
+        material = self.material
+        
+        future = self._executor.submit(
+            lambda: [material.section_data[section] for section in sections]
+        )
+        future.add_done_callback(
+            lambda future: self.root.after(
+                0, self._on_sections_parsed, future, material, request_id, on_parsed
+            )
+        )
+    
+    def _on_sections_parsed(self, future, material, request_id, on_parsed):
+        """Hand parsed sections to their consumer on the main thread unless superseded."""
+        if request_id != self._plot_request_id:
+            return
+        
+        # The file was switched while reading: nothing is drawn for this
+        # request, so repeating it must not be skipped as already displayed
+        if material is not self.material:
+            self._last_plot_key = None
+            return
+        
+        try:
+            parsed = future.result()
+        except Exception as e:
+            self._last_plot_key = None
+            messagebox.showerror("Error", f"Error reading section: {e}")
+            self.status_var.set("Error reading section")
+            return
+        
+        on_parsed(parsed)
+    
+    def _show_section(self, section_data, selected_mf, selected_mt):
+        """Plot or print a parsed section."""
         try:
-            # Check if compare mode is enabled
-            if self.compare_var.get():
-                self._plot_comparison()
-                return
-            
-            # Get selected MF and MT
-            selected_mf = int(self.mf_combo.get().split(':')[0])
-            selected_mt = int(self.mt_combo.get().split(':')[0])
-            
-            # Get the section data
-            if (selected_mf, selected_mt) not in self.material.section_data:
-                messagebox.showerror("Error", f"Section (MF={selected_mf}, MT={selected_mt}) not found")
-                return
-            
-            section_data = self.material.section_data[selected_mf, selected_mt]
-            
-            # Clear previous plot or text
-            self._clear_display_area()
-            
             # Create title
             title = f"MF={selected_mf} ({self._get_mf_description(selected_mf)}), " \
                     f"MT={selected_mt} ({self._get_mt_description(selected_mt)})"
@@ -269,7 +682,7 @@ class EndfGui:
             if selected_mf == 3 and 'sigma' in section_data:
                 try:
                     # Try to plot cross section data
-                    self._display_plot(section_data, title)
+                    self._display_plot(section_data, title, (selected_mf, selected_mt))
                     self.status_var.set(f"Plotted cross section (MF={selected_mf}, MT={selected_mt})")
                 except Exception as e:
                     # If that fails, try displaying as text
@@ -280,96 +693,133 @@ class EndfGui:
             else:
                 # For other sections, try to find plottable data first
                 try:
-                    self._display_plot(section_data, title)
+                    self._display_plot(section_data, title, (selected_mf, selected_mt))
                 except ValueError:
                     # If no plottable data, display as text
                     self._display_text_data(section_data, title)
             
         except Exception as e:
+            self._last_plot_key = None
             messagebox.showerror("Error", f"Error displaying section: {e}")
             self.status_var.set("Error displaying section")
     
-    def _clear_display_area(self):
-        """Clear the display area completely."""
-        # Destroy the entire container frame and all its children
-        if hasattr(self, 'display_container') and self.display_container.winfo_exists():
-            for widget in self.display_container.winfo_children():
-                widget.destroy()
+    def _prepare_axes(self):
+        """Show the plot area and clear the persistent axes for a new plot."""
+        self._axes_key = None
+        self._decimated_line = None
         
-        # Close any matplotlib figures
-        if hasattr(self, 'fig'):
-            plt.close(self.fig)
+        # Swap out the text widget if text was displayed last
+        if self.text_widget is not None:
+            self.text_widget.destroy()
+            self.text_widget = None
+            self.plot_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Reset references
-        self.canvas = None
-        self.toolbar = None
-        self.text_widget = None
+        self.ax.clear()
+    
+    def _prepare_text_area(self):
+        """Hide the plot area and create a fresh text widget."""
+        self._axes_key = None
         
-        # Force an update to ensure Tkinter cleans up everything
-        self.root.update()
+        if self.text_widget is not None:
+            self.text_widget.destroy()
+        else:
+            self.plot_frame.pack_forget()
+        
+        self.text_widget = scrolledtext.ScrolledText(
+            self.display_container,
+            width=80,
+            height=30,
+            wrap=tk.WORD,
+            font=('Courier', 10)
+        )
+        self.text_widget.pack(fill=tk.BOTH, expand=True)
     
-    def _reset_display_area(self):
-        """Completely reset the display area by recreating the container."""
-        # First destroy the old container
-        if hasattr(self, 'display_container') and self.display_container.winfo_exists():
-            self.display_container.destroy()
+    def _display_plot(self, section_data, title, section=None):
+        """Display plot for the section data."""
+        x_data, y_data, xlabel, ylabel = self._get_plot_data(section_data, section)
         
-        # Close any matplotlib figures
-        if hasattr(self, 'fig'):
-            plt.close(self.fig)
+        self._prepare_axes()
+        EndfPlotter.plot_general_data(
+            x_data, y_data,
+            title=title,
+            xlabel=xlabel,
+            ylabel=ylabel,
+            log_scale=self.log_scale_var.get(),
+            show=False,
+            ax=self.ax
+        )
         
-        # Reset references
-        self.canvas = None
-        self.toolbar = None
-        self.text_widget = None
+        # Thin very long curves to the axes' pixel width before the first draw,
+        # keeping the full arrays so zooming re-thins just the visible range
+        if len(x_data) > _DECIMATE_THRESHOLD:
+            self._decimated_line = (self.ax.lines[0], x_data, y_data)
+            self._redecimate(self.ax)
+            self.ax.callbacks.connect('xlim_changed', self._redecimate)
         
-        # Create a new container
-        self.display_container = ttk.Frame(self.right_panel)
-        self.display_container.pack(fill=tk.BOTH, expand=True)
+        # Remember which section is drawn so scale changes can restyle it
+        if section is not None:
+            self._axes_key = (self._material_key, tuple(section))
+        
+        # Redraw the persistent canvas and reset the toolbar's view history
+        self.canvas.draw_idle()
+        self.toolbar.update()
         
-        # Force an update to ensure Tkinter cleans up everything
-        self.root.update()
+        # Update display type flag
+        self.current_display_type = 'plot'
     
-    def _display_plot(self, section_data, title):
-        """Display plot for the section data."""
-        # Reset the display area completely
-        self._reset_display_area()
+    def _redecimate(self, ax):
+        """Re-thin the decimated curve to the visible x range and the axes' pixel width."""
+        if self._decimated_line is None:
+            return
+        line, x_full, y_full = self._decimated_line
+        
+        # Visible slice plus one point on each side so the curve reaches the edges
+        x_min, x_max = sorted(ax.get_xlim())
+        start = max(np.searchsorted(x_full, x_min) - 1, 0)
+        stop = np.searchsorted(x_full, x_max, side='right') + 1
+        
+        n = int(ax.bbox.width) * _DECIMATE_POINTS_PER_PIXEL
+        EndfPlotter.update_line(line, *EndfPlotter.decimate(
+            x_full[start:stop], y_full[start:stop], n, ax.get_xscale() == 'log'
+        ))
+    
+    def _get_plot_data(self, section_data, section=None):
+        """Get (x, y, xlabel, ylabel) for a section, reusing earlier extractions."""
+        cache_key = None
+        if section is not None and self._material_key is not None:
+            cache_key = (self._material_key,) + tuple(section)
+            if cache_key in self._plot_data_cache:
+                self._plot_data_cache.move_to_end(cache_key)
+                plot_data = self._plot_data_cache[cache_key]
+                if plot_data is None:
+                    raise ValueError("No plottable data found")
+                return plot_data
         
         # Check if the data can be plotted as a cross section
         if 'sigma' in section_data:
-            self.fig, self.ax = EndfPlotter.plot_cross_section(
-                section_data,
-                title=title,
-                log_scale=self.log_scale_var.get(),
-                show=False
-            )
+            x_data, y_data = EndfPlotter.get_cross_section_data(section_data)
+            xlabel, ylabel = 'Energy (eV)', 'Cross Section (barns)'
         else:
             # Otherwise look for general plottable data
             x_data, y_data, xlabel, ylabel = self._find_plottable_data(section_data)
-            
-            if x_data is not None and y_data is not None:
-                self.fig, self.ax = EndfPlotter.plot_general_data(
-                    x_data, y_data,
-                    title=title,
-                    xlabel=xlabel,
-                    ylabel=ylabel,
-                    log_scale=self.log_scale_var.get(),
-                    show=False
-                )
-            else:
-                raise ValueError("No plottable data found")
         
-        # Add the plot to the GUI
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.display_container)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        if x_data is None or y_data is None:
+            # Remember sections without plottable data so the search is not repeated
+            plot_data = None
+        else:
+            # Store plain float arrays so replots hand Matplotlib data it can use as-is
+            x_data = np.asarray(x_data, dtype=np.float64)
+            y_data = np.asarray(y_data, dtype=np.float64)
+            plot_data = (x_data, y_data, xlabel, ylabel)
         
-        # Add toolbar
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.display_container)
-        self.toolbar.update()
+        if cache_key is not None:
+            self._plot_data_cache[cache_key] = plot_data
+            if len(self._plot_data_cache) > _PLOT_DATA_CACHE_SIZE:
+                self._plot_data_cache.popitem(last=False)
         
-        # Update display type flag
-        self.current_display_type = 'plot'
+        if plot_data is None:
+            raise ValueError("No plottable data found")
+        return plot_data
     
     def _find_plottable_data(self, section_data):
         """Find plottable data in the section."""
@@ -379,27 +829,23 @@ class EndfGui:
         ylabel = None
         
         # Look for Tabulated1D objects first
-        for key in section_data:
-            if hasattr(section_data[key], 'x') and hasattr(section_data[key], 'y'):
-                x_data = section_data[key].x
-                y_data = section_data[key].y
-                xlabel = 'X values'
-                ylabel = f'{key} values'
-                break
-        
-        # If no Tabulated1D found, look for common arrays
-        if x_data is None:
-            for x_key in ['E', 'energy', 'x']:
-                if x_key in section_data and isinstance(section_data[x_key], (list, np.ndarray)):
-                    x_data = section_data[x_key]
-                    xlabel = 'Energy (eV)' if x_key in ['E', 'energy'] else 'X values'
-                    break
+        key = next((k for k, v in section_data.items() if isinstance(v, Tabulated1D)), None)
+        if key is not None:
+            x_data = section_data[key].x
+            y_data = section_data[key].y
+            xlabel = 'X values'
+            ylabel = f'{key} values'
+        else:
+            # If no Tabulated1D found, look for common arrays
+            x_key = _first_array_key(section_data, _X_KEYS)
+            if x_key is not None:
+                x_data = section_data[x_key]
+                xlabel = 'Energy (eV)' if x_key in ('E', 'energy') else 'X values'
             
-            for y_key in ['sigma', 'data', 'y']:
-                if y_key in section_data and isinstance(section_data[y_key], (list, np.ndarray)):
-                    y_data = section_data[y_key]
-                    ylabel = 'Cross Section (barns)' if y_key == 'sigma' else 'Y values'
-                    break
+            y_key = _first_array_key(section_data, _Y_KEYS)
+            if y_key is not None:
+                y_data = section_data[y_key]
+                ylabel = 'Cross Section (barns)' if y_key == 'sigma' else 'Y values'
         
         # Make sure x and y data have the same length
         if x_data is not None and y_data is not None and len(x_data) != len(y_data):
@@ -410,33 +856,26 @@ class EndfGui:
     
     def _display_text_data(self, section_data, title):
         """Display section data as text when it cannot be plotted."""
-        # Reset the display area completely
-        self._reset_display_area()
-        
-        # Create a new text widget
-        self.text_widget = scrolledtext.ScrolledText(
-            self.display_container,
-            width=80,
-            height=30,
-            wrap=tk.WORD,
-            font=('Courier', 10)
-        )
-        self.text_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # Insert title
-        self.text_widget.insert(tk.END, f"{title}\n", 'title')
-        self.text_widget.insert(tk.END, f"{'-' * len(title)}\n\n", 'title')
+        # Replace the plot (or previous text) with a new text widget
+        self._prepare_text_area()
         
         # Configure tags
         self.text_widget.tag_configure('title', font=('Courier', 12, 'bold'))
         self.text_widget.tag_configure('header', font=('Courier', 10, 'bold'))
         self.text_widget.tag_configure('value', font=('Courier', 10))
         
-        # Display all key-value pairs in the section
-        self.text_widget.insert(tk.END, "Section Data:\n", 'header')
+        # Title, followed by all key-value pairs in the section
+        chunks = [
+            (f"{title}\n", 'title'),
+            (f"{'-' * len(title)}\n\n", 'title'),
+            ("Section Data:\n", 'header'),
+        ]
         
         # Format the data nicely based on type
-        self._format_section_data(section_data)
+        chunks.extend(self._format_section_data(section_data))
+        
+        # Insert everything with a single Tcl call (text, tags, text, tags, ...)
+        self.text_widget.insert(tk.END, *(item for chunk in chunks for item in chunk))
         
         # Make the text widget read-only
         self.text_widget.config(state=tk.DISABLED)
@@ -447,29 +886,33 @@ class EndfGui:
         self.status_var.set(f"Displaying text data for section")
     
     def _format_section_data(self, section_data, indent=""):
-        """Format section data for text display with proper indentation and structure."""
+        """Format section data as (text, tag) chunks with proper indentation and structure."""
+        chunks = []
+        
         # Check for empty data
         if not section_data:
-            self.text_widget.insert(tk.END, f"{indent}No data available\n")
-            return
+            chunks.append((f"{indent}No data available\n", ''))
+            return chunks
         
-        # Separate scalar values and array/complex values for better display
-        scalars = {}
-        arrays = {}
-        objects = {}
+        # Separate scalar values and array/complex values for better display,
+        # sorting the keys once so every group comes out in key order
+        scalars = []
+        arrays = []
+        objects = []
         
-        for key, value in section_data.items():
+        for key in sorted(section_data):
+            value = section_data[key]
             if isinstance(value, (int, float, str, bool)) or value is None:
-                scalars[key] = value
-            elif isinstance(value, (list, np.ndarray)) or hasattr(value, 'shape'):
-                arrays[key] = value
+                scalars.append((key, value))
+            elif isinstance(value, (list, np.ndarray)) or getattr(value, 'shape', None) is not None:
+                arrays.append((key, value))
             else:
-                objects[key] = value
+                objects.append((key, value))
         
         # Display scalars first (simple key-value pairs)
         if scalars:
-            self.text_widget.insert(tk.END, f"{indent}Scalar Values:\n", 'header')
-            for key, value in sorted(scalars.items()):
+            chunks.append((f"{indent}Scalar Values:\n", 'header'))
+            for key, value in scalars:
                 # Format numbers nicely
                 if isinstance(value, float):
                     if abs(value) < 0.001 or abs(value) > 1000:
@@ -479,65 +922,78 @@ class EndfGui:
                 else:
                     formatted_value = str(value)
                 
-                self.text_widget.insert(tk.END, f"{indent}  {key}: ", 'header')
-                self.text_widget.insert(tk.END, f"{formatted_value}\n", 'value')
+                chunks.append((f"{indent}  {key}: ", 'header'))
+                chunks.append((f"{formatted_value}\n", 'value'))
         
         # Display array data with size info
         if arrays:
-            self.text_widget.insert(tk.END, f"\n{indent}Array Data:\n", 'header')
-            for key, value in sorted(arrays.items()):
-                if hasattr(value, 'shape'):
-                    size_info = f"shape={value.shape}"
-                elif hasattr(value, '__len__'):
-                    size_info = f"length={len(value)}"
+            chunks.append((f"\n{indent}Array Data:\n", 'header'))
+            for key, value in arrays:
+                # Everything here is array-like with a shape, or a plain list
+                shape = getattr(value, 'shape', None)
+                if shape is not None:
+                    size_info = f"shape={shape}"
+                    length = shape[0] if shape else 0
                 else:
-                    size_info = "unknown size"
+                    length = len(value)
+                    size_info = f"length={length}"
                 
-                self.text_widget.insert(tk.END, f"{indent}  {key}: ", 'header')
-                self.text_widget.insert(tk.END, f"{size_info}\n", 'value')
+                chunks.append((f"{indent}  {key}: ", 'header'))
+                chunks.append((f"{size_info}\n", 'value'))
                 
                 # Show a sample of array values
-                if hasattr(value, '__len__') and len(value) > 0:
-                    sample_size = min(5, len(value))
-                    self.text_widget.insert(tk.END, f"{indent}    Sample: [", 'value')
-                    for i in range(sample_size):
-                        if isinstance(value[i], float):
-                            self.text_widget.insert(tk.END, f"{value[i]:.6e}", 'value')
-                        else:
-                            self.text_widget.insert(tk.END, f"{value[i]}", 'value')
-                        
-                        if i < sample_size - 1:
-                            self.text_widget.insert(tk.END, ", ", 'value')
+                if length > 0:
+                    sample_size = min(5, length)
+                    sample = value[:sample_size]
+                    
+                    if isinstance(sample, np.ndarray) and sample.ndim == 1 and sample.dtype == np.float64:
+                        # Format the whole float sample in one NumPy call
+                        sample_text = np.array2string(
+                            sample,
+                            separator=', ',
+                            max_line_width=sys.maxsize,
+                            formatter=_SAMPLE_FORMATTER
+                        )[1:-1]
+                    else:
+                        sample_text = ", ".join(
+                            f"{item:.6e}" if isinstance(item, float) else f"{item}" for item in sample
+                        )
+                    
+                    chunks.append((f"{indent}    Sample: [{sample_text}", 'value'))
                     
-                    if len(value) > sample_size:
-                        self.text_widget.insert(tk.END, f", ... ({len(value) - sample_size} more)", 'value')
+                    if length > sample_size:
+                        chunks.append((f", ... ({length - sample_size} more)", 'value'))
                     
-                    self.text_widget.insert(tk.END, "]\n", 'value')
+                    chunks.append(("]\n", 'value'))
         
         # Display complex objects
         if objects:
-            self.text_widget.insert(tk.END, f"\n{indent}Complex Objects:\n", 'header')
-            for key, value in sorted(objects.items()):
-                self.text_widget.insert(tk.END, f"{indent}  {key}: ", 'header')
+            chunks.append((f"\n{indent}Complex Objects:\n", 'header'))
+            for key, value in objects:
+                chunks.append((f"{indent}  {key}: ", 'header'))
                 
                 # For Tabulated1D objects or similar
-                if hasattr(value, 'x') and hasattr(value, 'y'):
-                    x_len = len(value.x) if hasattr(value.x, '__len__') else 'unknown'
-                    self.text_widget.insert(tk.END, f"Tabulated data with {x_len} points\n", 'value')
+                x_values = getattr(value, 'x', None)
+                if x_values is not None and getattr(value, 'y', None) is not None:
+                    x_len = len(x_values) if isinstance(x_values, (list, tuple, np.ndarray)) else 'unknown'
+                    chunks.append((f"Tabulated data with {x_len} points\n", 'value'))
                 else:
                     # Generic object info
                     obj_type = type(value).__name__
-                    self.text_widget.insert(tk.END, f"{obj_type}\n", 'value')
+                    chunks.append((f"{obj_type}\n", 'value'))
                     
                     # Try to get attributes if available
-                    if hasattr(value, '__dict__'):
-                        attrs = {k: v for k, v in vars(value).items() if not k.startswith('_')}
+                    instance_dict = getattr(value, '__dict__', None)
+                    if instance_dict is not None:
+                        attrs = {k: v for k, v in instance_dict.items() if not k.startswith('_')}
                         if attrs:
-                            self.text_widget.insert(tk.END, f"{indent}    Attributes:\n", 'header')
+                            chunks.append((f"{indent}    Attributes:\n", 'header'))
                             for attr_name, attr_value in attrs.items():
                                 if isinstance(attr_value, (int, float, str, bool)) or attr_value is None:
-                                    self.text_widget.insert(tk.END, f"{indent}      {attr_name}: ", 'header')
-                                    self.text_widget.insert(tk.END, f"{attr_value}\n", 'value')
+                                    chunks.append((f"{indent}      {attr_name}: ", 'header'))
+                                    chunks.append((f"{attr_value}\n", 'value'))
+        
+        return chunks
     
     def _plot_generic_data(self, section_data, title):
         """Try to plot generic data from a section."""
@@ -555,34 +1011,31 @@ class EndfGui:
         if not self.material:
             return
         
+        # Parse the compared sections off the main thread before plotting them
+        common_mt = self._common_mt
+        self.status_var.set("Reading cross sections...")
+        self._parse_in_background(
+            self._comparison_sections, lambda parsed: self._draw_comparison(common_mt)
+        )
+    
+    def _draw_comparison(self, common_mt):
+        """Draw the comparison plot into the persistent axes."""
         try:
-            # Common important cross sections to compare
-            common_mt = [1, 2, 102]  # Total, elastic, capture
-            
-            # Add any others that are available in the material
-            for mt in [16, 18, 103, 104, 105]:  # n,2n - fission - n,p - n,d - n,t
-                if (3, mt) in self.material.section_data:
-                    common_mt.append(mt)
-            
-            # Reset the display area
-            self._reset_display_area()
-            
-            # Create a new multi-plot
-            self.fig, self.ax = EndfPlotter.plot_multiple_cross_sections(
+            # Plot into the persistent axes
+            self._prepare_axes()
+            EndfPlotter.plot_multiple_cross_sections(
                 self.material,
                 common_mt,
                 title=f"Cross Section Comparison",
                 log_scale=self.log_scale_var.get(),
-                show=False
+                show=False,
+                ax=self.ax,
+                max_points=None
             )
+            self._axes_key = (self._material_key, None)
             
-            # Add the plot to the GUI
-            self.canvas = FigureCanvasTkAgg(self.fig, master=self.display_container)
-            self.canvas.draw()
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Add toolbar
-            self.toolbar = NavigationToolbar2Tk(self.canvas, self.display_container)
+            # Redraw the persistent canvas and reset the toolbar's view history
+            self.canvas.draw_idle()
             self.toolbar.update()
             
             # Update display type flag
@@ -590,50 +1043,17 @@ class EndfGui:
             
             self.status_var.set(f"Plotted comparison of common cross sections")
         except Exception as e:
+            self._last_plot_key = None
             messagebox.showerror("Error", f"Error plotting comparison: {e}")
             self.status_var.set("Error plotting comparison")
     
     def _get_mf_description(self, mf):
         """Get description for an MF number."""
-        mf_descriptions = {
-            1: "General Information",
-            2: "Resonance Parameters",
-            3: "Cross Sections",
-            4: "Angular Distributions",
-            5: "Energy Distributions",
-            6: "Energy-Angle Distributions",
-            7: "Thermal Scattering Data",
-            8: "Radioactivity and Fission-Product Yields",
-            9: "Multiplicities",
-            10: "Cross Sections for Production of Radioactive Nuclides",
-            12: "Multiplicities and Transition Probability Arrays",
-            13: "Photon Production Cross Sections",
-            14: "Photon Angular Distributions",
-            15: "Continuous Photon Energy Spectra",
-            23: "Smooth Photon Interaction Cross Sections",
-            27: "Atomic Form Factors"
-        }
-        return mf_descriptions.get(mf, f"File {mf}")
+        return describe_mf(mf)
     
     def _get_mt_description(self, mt):
         """Get description for an MT number."""
-        mt_descriptions = {
-            1: "Total cross section",
-            2: "Elastic scattering",
-            3: "Nonelastic cross section",
-            4: "Inelastic cross section",
-            5: "Sum of all reactions not given explicitly",
-            16: "(n,2n)",
-            17: "(n,3n)",
-            18: "Fission",
-            51: "Inelastic scattering to 1st excited state",
-            102: "Radiative capture (n,gamma)",
-            103: "(n,p)",
-            104: "(n,d)",
-            105: "(n,t)",
-            451: "File information and dictionary"
-        }
-        return mt_descriptions.get(mt, f"MT={mt}")
+        return describe_mt(mt)
 
 
 def run_gui(data_dir="data"):
@@ -2,9 +2,285 @@
 ENDF file loader module.
 """
 
+import functools
+import io
+import mmap
+import os
+import weakref
+from collections import namedtuple
+from collections.abc import Mapping
 from pathlib import Path
+import numpy as np
 import endf
 
+from .endf_tables import describe_mf, describe_mt, describe_section
+
+
+# Number of fully parsed materials kept in memory by load_file
+_MATERIAL_CACHE_SIZE = 16
+
+# Number of individually parsed sections kept in memory by the lazy loader
+_SECTION_CACHE_SIZE = 64
+
+# MEND record appended after a single section so endf.Material stops parsing
+_MEND_RECORD = " " * 66 + "   0 0  0    0\n"
+
+# MF files whose every section endf.Material parses, and the sections it parses
+# from the other files; it skips anything else with a warning
+_PARSED_MFS = frozenset({3, 4, 5, 6, 8, 9, 10, 12, 13, 14, 15, 23, 26, 27, 28, 33, 34, 40})
+_PARSED_SECTIONS = frozenset({
+    (1, 451), (1, 452), (1, 455), (1, 456), (1, 458), (1, 460),
+    (2, 151), (7, 2), (7, 4), (7, 451)
+})
+
+
+# Per-file counters bumped by EndfLoader.invalidate so cached parses are no longer hit
+_generations = {}
+
+# Sorted (MF, MT) keys of each live material, dropped with the material
+_sorted_keys = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=_MATERIAL_CACHE_SIZE)
+def _parse_material(path, mtime_ns, size, generation):
+    """
+    Parse a complete ENDF file.
+    
+    Args:
+        path (str): Resolved path to the ENDF file.
+        mtime_ns (int): Modification time of the file, only used to key the cache.
+        size (int): Size of the file, only used to key the cache.
+        generation (int): Invalidation counter of the file, only used to key the cache.
+        
+    Returns:
+        endf.Material: The parsed ENDF material.
+    """
+    return endf.Material(path)
+
+
+def _load_material(file_path):
+    """Parse an ENDF file through the material cache."""
+    path = str(Path(file_path).resolve())
+    stat = os.stat(path)
+    return _parse_material(path, stat.st_mtime_ns, stat.st_size, _generations.get(path, 0))
+
+
+@functools.lru_cache(maxsize=_SECTION_CACHE_SIZE)
+def _parse_section(path, mtime_ns, offset, length):
+    """
+    Parse a single section of an ENDF file from its byte range.
+    
+    Args:
+        path (str): Path to the ENDF file.
+        mtime_ns (int): Modification time of the file, only used to key the cache.
+        offset (int): Byte offset of the first record of the section.
+        length (int): Length in bytes of the section, including its SEND record.
+        
+    Returns:
+        dict: The parsed section data.
+        
+    Raises:
+        ValueError: If endf.Material does not parse the section.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        text = f.read(length).decode('ascii', errors='replace')
+    
+    # Wrap the section in an empty TPID line and a MEND record so it reads
+    # like a complete single-section material
+    material = endf.Material(io.StringIO("\n" + text + _MEND_RECORD, newline=None))
+    if not material.section_data:
+        raise ValueError(f"Section at byte {offset} of '{path}' is not a section endf can parse")
+    return next(iter(material.section_data.values()))
+
+
+@functools.lru_cache(maxsize=_MATERIAL_CACHE_SIZE)
+def _index_file(path, mtime_ns, size):
+    """
+    Index the sections of an ENDF file.
+    
+    The file is memory-mapped, so scanning it does not copy it into
+    Python objects and repeated scans reuse the kernel's page cache.
+    
+    Args:
+        path (str): Path to the ENDF file.
+        mtime_ns (int): Modification time of the file, only used to key the cache.
+        size (int): Size of the file, only used to key the cache.
+        
+    Returns:
+        tuple: MAT number and the (MF, MT) to (offset, length) index.
+        
+    Raises:
+        Exception: If the file is empty or not a valid ENDF file.
+    """
+    with open(path, 'rb') as f:
+        if size == 0:
+            raise Exception("Error parsing ENDF file: file is empty")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buf = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                mat, index = _index_records(buf)
+                error = None
+            except Exception as e:
+                # Only the message is kept: the traceback's frames still hold
+                # views of buf, which would stop the mapping from closing
+                error = str(e)
+            finally:
+                # The mapping cannot be closed while an array still exports it
+                del buf
+    
+    if error is not None:
+        raise Exception(f"Error parsing ENDF file: {error}")
+    if mat is None or not index:
+        raise Exception("Error parsing ENDF file: no ENDF sections found")
+    return mat, index
+
+
+def _scan_file(path):
+    """
+    Index the sections of an ENDF file through the index cache.
+    
+    Args:
+        path (str): Path to the ENDF file.
+        
+    Returns:
+        tuple: Modification time of the indexed file, its MAT number and
+            the (MF, MT) to (offset, length) index.
+    """
+    stat = os.stat(path)
+    mat, index = _index_file(path, stat.st_mtime_ns, stat.st_size)
+    return stat.st_mtime_ns, mat, index
+
+
+def _index_records(buf):
+    """
+    Index the sections of an ENDF file from its raw bytes.
+    
+    Each record only has its MT and MAT columns checked, all at once in
+    NumPy; the MF/MT values are decoded for section starts alone. Only
+    copies of buf are kept, never views. Sections that endf.Material
+    skips are left out of the index.
+    
+    Args:
+        buf (np.ndarray): Contents of the file as a uint8 array.
+        
+    Returns:
+        tuple: MAT number and the (MF, MT) to (offset, length) index.
+    """
+    # Record boundaries, skipping the TPID record on the first line
+    newlines = np.flatnonzero(buf == ord('\n'))
+    starts = newlines + 1
+    ends = np.append(newlines[1:] + 1, len(buf))
+    content_ends = np.append(newlines[1:], len(buf))
+    
+    # Records too short to carry MAT/MF/MT columns are not looked at
+    valid = content_ends - starts >= 75
+    starts, ends = starts[valid], ends[valid]
+    
+    # Only the first material is read: stop at its MEND (MAT 0) or a TEND (MAT -1) record
+    mat_tail = buf[starts + 68]
+    material_end = np.flatnonzero(((buf[starts + 69] == ord('0')) & (mat_tail == ord(' ')))
+                                  | (mat_tail == ord('-')))
+    if len(material_end):
+        starts, ends = starts[:material_end[0]], ends[:material_end[0]]
+    
+    # Sections run from the first record with MT > 0 up to and including
+    # their SEND record, the first one with MT "  0"
+    in_section = ~((buf[starts + 74] == ord('0'))
+                   & (buf[starts + 73] == ord(' '))
+                   & (buf[starts + 72] == ord(' ')))
+    after_section = np.concatenate(([False], in_section[:-1]))
+    first_rows = np.flatnonzero(in_section & ~after_section)
+    send_rows = np.flatnonzero(~in_section & after_section)
+    first_rows = first_rows[:len(send_rows)]
+    
+    offsets = starts[first_rows]
+    lengths = ends[send_rows] - offsets
+    fields = [bytes(buf[start + 66:start + 75]) for start in offsets]
+    index = {}
+    for field, offset, length in zip(fields, offsets, lengths):
+        mf, mt = int(field[4:6]), int(field[6:9])
+        if mf in _PARSED_MFS or (mf, mt) in _PARSED_SECTIONS:
+            index[mf, mt] = (int(offset), int(length))
+    return (int(fields[0][:4]) if fields else None), index
+
+
+# Basic information about a material: a dict of header values and a list of
+# (MF, MT, description) tuples, one per section
+EvaluationSummary = namedtuple('EvaluationSummary', ['metadata', 'sections'])
+
+
+class _LazySectionData(Mapping):
+    """
+    Mapping of (MF, MT) to section data that parses each section on access.
+    
+    A file rewritten since it was indexed is indexed again before a section
+    is read, so sections are never read from stale offsets.
+    """
+    
+    def __init__(self, path, mtime_ns, index):
+        self._path = path
+        self._mtime_ns = mtime_ns
+        self._index = index
+    
+    def __getitem__(self, key):
+        if os.stat(self._path).st_mtime_ns != self._mtime_ns:
+            self._mtime_ns, _, self._index = _scan_file(self._path)
+        
+        if key not in self._index:
+            raise KeyError(f"Section {key} not found in '{self._path}'")
+        offset, length = self._index[key]
+        return _parse_section(self._path, self._mtime_ns, offset, length)
+    
+    def __contains__(self, key):
+        return key in self._index
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def __len__(self):
+        return len(self._index)
+
+
+class LazyMaterial:
+    """ENDF material backed by a section index, parsing sections only when accessed."""
+    
+    def __init__(self, file_path, index, mat=None, mtime_ns=None):
+        """
+        Initialize the lazy material.
+        
+        Args:
+            file_path (str or Path): Path to the ENDF file.
+            index (dict): Mapping of (MF, MT) to (offset, length) byte ranges.
+            mat (int): MAT number of the material.
+            mtime_ns (int): Modification time of the file when it was indexed.
+                The current modification time is used if None.
+        """
+        self.file_path = Path(file_path)
+        self.MAT = mat
+        if mtime_ns is None:
+            mtime_ns = os.stat(self.file_path).st_mtime_ns
+        self.section_data = _LazySectionData(str(self.file_path), mtime_ns, index)
+    
+    def __contains__(self, mf_mt):
+        return mf_mt in self.section_data
+    
+    def __getitem__(self, mf_mt):
+        return self.section_data[mf_mt]
+    
+    def __repr__(self):
+        return f"<LazyMaterial MAT={self.MAT} from '{self.file_path.name}'>"
+    
+    @property
+    def sections(self):
+        """List of (MF, MT) pairs present in the material."""
+        return list(self.section_data)
+    
+    def interpret(self):
+        """Fully parse the file and interpret it like endf.Material.interpret."""
+        return _load_material(self.file_path).interpret()
+
 
 class EndfLoader:
     """Class for loading and parsing ENDF files."""
@@ -27,12 +303,20 @@ class EndfLoader:
         Returns:
             list: List of Path objects for each ENDF file.
         """
-        return sorted(self.data_dir.glob("*.endf"))
+        # DirEntry.is_file() answers from the directory entry type for regular
+        # files, avoiding the per-entry stat and Path construction of glob
+        with os.scandir(self.data_dir) as entries:
+            names = [entry.name for entry in entries
+                     if entry.name.endswith(".endf") and entry.is_file()]
+        return [self.data_dir / name for name in sorted(names)]
     
     def load_file(self, file_path):
         """
         Load and parse an ENDF file.
         
+        Parsed materials are cached by path, modification time and size, so
+        loading an unchanged file again returns the same shared object.
+        
         Args:
             file_path (str or Path): Path to the ENDF file.
             
@@ -48,12 +332,123 @@ class EndfLoader:
             raise FileNotFoundError(f"File '{file_path}' not found.")
         
         try:
-            # Use the Material class to parse the file
-            material = endf.Material(str(file_path))
-            return material
+            # Use the Material class to parse the file, or reuse an earlier parse
+            return _load_material(file_path)
         except Exception as e:
             raise Exception(f"Error parsing ENDF file: {e}")
     
+    def invalidate(self, file_path):
+        """
+        Make the next load_file call for a file parse it again.
+        
+        Superseded entries are never returned again and drop out of the
+        cache as new files are loaded. Lazily loaded sections are keyed by
+        the file's modification time and do not need invalidating.
+        
+        Args:
+            file_path (str or Path): Path to the ENDF file.
+        """
+        path = str(Path(file_path).resolve())
+        _generations[path] = _generations.get(path, 0) + 1
+    
+    def load_index(self, file_path):
+        """
+        Index the sections of an ENDF file without parsing them.
+        
+        Args:
+            file_path (str or Path): Path to the ENDF file.
+            
+        Returns:
+            dict: Mapping of (MF, MT) to the (offset, length) byte range of each section.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: If the file is not a valid ENDF file.
+        """
+        return dict(self._scan_sections(Path(file_path))[2])
+    
+    def load_file_lazy(self, file_path):
+        """
+        Load an ENDF file, deferring the parsing of each section until it is accessed.
+        
+        Indexes are cached by path, modification time and size, so loading
+        an unchanged file again does not scan it again.
+        
+        Args:
+            file_path (str or Path): Path to the ENDF file.
+            
+        Returns:
+            LazyMaterial: Material whose section_data parses sections on demand.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Exception: If the file is not a valid ENDF file.
+        """
+        file_path = Path(file_path)
+        mtime_ns, mat, index = self._scan_sections(file_path)
+        return LazyMaterial(file_path, index, mat, mtime_ns)
+    
+    def load_section(self, file_path, mf, mt):
+        """
+        Load and parse a single section of an ENDF file.
+        
+        Args:
+            file_path (str or Path): Path to the ENDF file.
+            mf (int): MF number of the section.
+            mt (int): MT number of the section.
+            
+        Returns:
+            dict: The parsed section data.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the section is not present in the file.
+            Exception: If there is an error parsing the section.
+        """
+        material = self.load_file_lazy(file_path)
+        if (mf, mt) not in material.section_data:
+            raise ValueError(f"Section MF={mf}, MT={mt} not found in '{file_path}'.")
+        
+        try:
+            return material.section_data[mf, mt]
+        except Exception as e:
+            raise Exception(f"Error parsing ENDF section: {e}")
+    
+    def _scan_sections(self, file_path):
+        """
+        Scan an ENDF file for the byte ranges of its sections.
+        
+        Args:
+            file_path (Path): Path to the ENDF file.
+            
+        Returns:
+            tuple: Modification time of the file, its MAT number and the
+                (MF, MT) to (offset, length) index.
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File '{file_path}' not found.")
+        
+        return _scan_file(str(file_path.resolve()))
+    
+    def sorted_keys(self, material):
+        """
+        Get the (MF, MT) keys of a material in ascending order.
+        
+        The sorted keys are computed once per material object and reused
+        until the material is garbage collected or its sections change.
+        
+        Args:
+            material (endf.Material or LazyMaterial): The ENDF material.
+            
+        Returns:
+            tuple: Sorted (MF, MT) tuples.
+        """
+        keys = _sorted_keys.get(material)
+        if keys is None or len(keys) != len(material.section_data):
+            keys = tuple(sorted(material.section_data))
+            _sorted_keys[material] = keys
+        return keys
+    
     def get_high_level_data(self, material):
         """
         Get high-level data from the ENDF material by interpreting it.
@@ -71,38 +466,62 @@ class EndfLoader:
             print(f"Warning: Could not interpret material: {e}")
             return None
     
-    def get_evaluation_info(self, material):
+    def get_evaluation_info_fast(self, material):
         """
-        Extract basic information from an ENDF material.
+        Extract basic information from an ENDF material as plain tuples.
+        
+        Unlike get_evaluation_info, no per-section dicts are built, which
+        suits callers that just iterate over the sections.
         
         Args:
             material (endf.Material): The ENDF material.
             
         Returns:
-            dict: Dictionary containing basic information about the material.
+            EvaluationSummary: Header metadata and (MF, MT, description) tuples.
         """
-        info = {"sections": []}
+        metadata = {}
         
         # Add basic material info
         for attr in ['MAT', 'ZA', 'AWR']:
             if hasattr(material, attr):
-                info[attr] = getattr(material, attr)
+                metadata[attr] = getattr(material, attr)
         
         # Get metadata from MF=1, MT=451 if available
         if (1, 451) in material.section_data:
             header = material.section_data[1, 451]
             for key in ['ZA', 'AWR', 'LREL', 'LRP', 'TEMP']:
                 if key in header:
-                    info[key] = header[key]
+                    metadata[key] = header[key]
         
         # Add information about available sections
-        for (mf, mt) in sorted(material.section_data.keys()):
-            section_info = {
-                "mf": mf,
-                "mt": mt,
-                "description": self._get_section_description(mf, mt)
-            }
-            info["sections"].append(section_info)
+        sections = [(mf, mt, describe_section(mf, mt)) for mf, mt in self.sorted_keys(material)]
+        
+        return EvaluationSummary(metadata, sections)
+    
+    def get_evaluation_info(self, material, include_interpretation=False):
+        """
+        Extract basic information from an ENDF material.
+        
+        Args:
+            material (endf.Material): The ENDF material.
+            include_interpretation (bool): Whether to interpret the material
+                and add its data type and reactions. Interpreting parses the
+                whole evaluation, so it is skipped unless requested.
+            
+        Returns:
+            dict: Dictionary containing basic information about the material.
+        """
+        summary = self.get_evaluation_info_fast(material)
+        info = {
+            "sections": [
+                {"mf": mf, "mt": mt, "description": description}
+                for mf, mt, description in summary.sections
+            ]
+        }
+        info.update(summary.metadata)
+        
+        if not include_interpretation:
+            return info
         
         # Try to get high-level data
         interpreted = self.get_high_level_data(material)
@@ -132,17 +551,7 @@ class EndfLoader:
         Returns:
             str: Description of the section.
         """
-        # Special case for file info section
-        if mf == 1 and mt == 451:
-            return "General information"
-        
-        # First get the MF description
-        mf_desc = self._get_mf_description(mf)
-        
-        # Then get the MT description
-        mt_desc = self._get_mt_description(mt)
-        
-        return f"{mf_desc} - {mt_desc}"
+        return describe_section(mf, mt)
     
     def _get_mf_description(self, mf):
         """
@@ -154,25 +563,7 @@ class EndfLoader:
         Returns:
             str: Description of the MF file.
         """
-        mf_descriptions = {
-            1: "General Information",
-            2: "Resonance Parameters",
-            3: "Cross Sections",
-            4: "Angular Distributions",
-            5: "Energy Distributions",
-            6: "Energy-Angle Distributions",
-            7: "Thermal Scattering Data",
-            8: "Radioactivity and Fission-Product Yields",
-            9: "Multiplicities",
-            10: "Cross Sections for Production of Radioactive Nuclides",
-            12: "Multiplicities and Transition Probability Arrays",
-            13: "Photon Production Cross Sections",
-            14: "Photon Angular Distributions",
-            15: "Continuous Photon Energy Spectra",
-            23: "Smooth Photon Interaction Cross Sections",
-            27: "Atomic Form Factors"
-        }
-        return mf_descriptions.get(mf, f"File {mf}")
+        return describe_mf(mf)
     
     def _get_mt_description(self, mt):
         """
@@ -184,22 +575,4 @@ class EndfLoader:
         Returns:
             str: Description of the MT reaction.
         """
-        # Common MT numbers and their descriptions
-        mt_descriptions = {
-            1: "Total cross section",
-            2: "Elastic scattering",
-            3: "Nonelastic cross section",
-            4: "Inelastic cross section",
-            5: "Sum of all reactions not given explicitly",
-            16: "(n,2n)",
-            17: "(n,3n)",
-            18: "Fission",
-            51: "Inelastic scattering to 1st excited state",
-            102: "Radiative capture (n,gamma)",
-            103: "(n,p)",
-            104: "(n,d)",
-            105: "(n,t)",
-            451: "File information and dictionary"
-        }
-        
-        return mt_descriptions.get(mt, f"MT={mt}") 
\ No newline at end of file
+        return describe_mt(mt) 
\ No newline at end of file
@@ -4,24 +4,35 @@ ENDF data plotting module.
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+from .endf_tables import describe_mt
+
+# Distance between markers as a fraction of the axes diagonal, so a curve
+# gets a few dozen markers however many points it has
+_MARKER_SPACING = 0.02
+
+# Curves longer than this are drawn from log10 data on linear axes when
+# prelog is requested
+_PRELOG_THRESHOLD = 5000
+
+# Curves longer than this are rasterized; shorter ones stay vector graphics
+_RASTERIZE_THRESHOLD = 5000
 
 
 class EndfPlotter:
     """Class for plotting ENDF data."""
     
     @staticmethod
-    def plot_cross_section(section_data, title=None, log_scale=True, show=True):
+    def get_cross_section_data(section_data):
         """
-        Plot cross section data from an ENDF file.
+        Extract the energy and cross section arrays from a cross section section.
         
         Args:
             section_data (dict): Section data containing 'sigma' key with a Tabulated1D object
-            title (str): Plot title
-            log_scale (bool): Whether to use logarithmic scales
-            show (bool): Whether to show the plot immediately
             
         Returns:
-            tuple: (fig, ax) matplotlib figure and axes objects
+            tuple: (x_data, y_data) energy and cross section values
         """
         # Check for required data
         if 'sigma' not in section_data:
@@ -32,22 +43,116 @@ class EndfPlotter:
         
         # If sigma is a Tabulated1D object, get its x and y values
         if hasattr(sigma, 'x') and hasattr(sigma, 'y'):
-            x_data = sigma.x
-            y_data = sigma.y
-
+            return sigma.x, sigma.y
         elif 'E' in section_data and isinstance(section_data['sigma'], (list, np.ndarray)):
-            x_data = section_data['E']
-            y_data = section_data['sigma']
+            return section_data['E'], section_data['sigma']
         else:
             raise ValueError("Could not find plottable cross section data. The 'sigma' key must be a Tabulated1D object or there must be 'E' and 'sigma' arrays.")
+    
+    @staticmethod
+    def decimate(x, y, n=2000, log_scale=False):
+        """
+        Reduce a curve to n points with Largest-Triangle-Three-Buckets.
+        
+        The first and last points are always kept and the rest are split into
+        n - 2 buckets. Each bucket keeps the point forming the largest triangle
+        with the means of its neighbouring buckets, which lets all buckets be
+        solved at once in NumPy. Areas are measured in log space for log plots.
+        
+        Args:
+            x (np.ndarray): X values, sorted ascending.
+            y (np.ndarray): Y values.
+            n (int): Number of points to keep.
+            log_scale (bool): Whether the curve is drawn on log-log axes.
+            
+        Returns:
+            tuple: (x, y) arrays holding the selected points.
+        """
+        size = len(x)
+        if size <= n or n < 3:
+            return x, y
+        
+        if log_scale:
+            tiny = np.finfo(np.float64).tiny
+            px = np.log10(np.maximum(x, tiny))
+            py = np.log10(np.maximum(y, tiny))
+        else:
+            px, py = x, y
+        
+        # Bucket boundaries over the interior points 1 .. size-2
+        edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+        starts, ends = edges[:-1], edges[1:]
+        counts = ends - starts
+        
+        # Bucket means via cumulative sums
+        sum_x = np.concatenate(([0.0], np.cumsum(px)))
+        sum_y = np.concatenate(([0.0], np.cumsum(py)))
+        mean_x = (sum_x[ends] - sum_x[starts]) / counts
+        mean_y = (sum_y[ends] - sum_y[starts]) / counts
+        
+        # Anchors: previous and next bucket means, or the end points at the edges
+        prev_x = np.concatenate(([px[0]], mean_x[:-1]))
+        prev_y = np.concatenate(([py[0]], mean_y[:-1]))
+        next_x = np.concatenate((mean_x[1:], [px[-1]]))
+        next_y = np.concatenate((mean_y[1:], [py[-1]]))
+        
+        # Twice the triangle area for every interior point against its bucket's anchors
+        bucket = np.repeat(np.arange(len(counts)), counts)
+        left_x, left_y = prev_x[bucket], prev_y[bucket]
+        right_x, right_y = next_x[bucket], next_y[bucket]
+        interior_x = px[starts[0]:ends[-1]]
+        interior_y = py[starts[0]:ends[-1]]
+        areas = np.abs(
+            (left_x - right_x) * (interior_y - left_y) - (left_x - interior_x) * (right_y - left_y)
+        )
+        
+        # First point with the largest area in each bucket
+        max_areas = np.maximum.reduceat(areas, starts - starts[0])
+        candidates = np.flatnonzero(areas == max_areas[bucket])
+        _, first = np.unique(bucket[candidates], return_index=True)
+        selected = np.concatenate(([0], candidates[first] + starts[0], [size - 1]))
+        
+        return x[selected], y[selected]
+    
+    @staticmethod
+    def plot_cross_section(section_data, title=None, log_scale=True, show=True, ax=None,
+                           max_points=2000, prelog=False):
+        """
+        Plot cross section data from an ENDF file.
+        
+        Args:
+            section_data (dict): Section data containing 'sigma' key with a Tabulated1D object
+            title (str): Plot title
+            log_scale (bool): Whether to use logarithmic scales
+            show (bool): Whether to show the plot immediately
+            ax (matplotlib.axes.Axes): Existing axes to plot into. A new figure
+                is created if None.
+            max_points (int): Longer curves are decimated to this many points.
+                All points are plotted if None.
+            prelog (bool): Draw long log-scale curves from precomputed log10
+                values on linear axes, see ``plot_general_data``. The length
+                is taken before decimation.
+            
+        Returns:
+            tuple: (fig, ax) matplotlib figure and axes objects
+        """
+        x_data, y_data = EndfPlotter.get_cross_section_data(section_data)
+        prelog = prelog and log_scale and len(x_data) > _PRELOG_THRESHOLD
+        if max_points is not None:
+            x_data, y_data = EndfPlotter.decimate(
+                np.asarray(x_data), np.asarray(y_data), max_points, log_scale
+            )
         
-        fig, ax = plt.subplots(figsize=(8, 6))
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(8, 6))
+        else:
+            fig = ax.figure
         
+        EndfPlotter._draw_line(ax, x_data, y_data, log_scale, prelog,
+                               marker='.', markersize=4, markevery=_MARKER_SPACING)
         if log_scale:
-            ax.loglog(x_data, y_data, '-', lw=2, marker='.', markersize=4)
             ax.grid(True, which='both', linestyle='--', alpha=0.7)
         else:
-            ax.plot(x_data, y_data, '-', lw=2, marker='.', markersize=4)
             ax.grid(True, linestyle='--', alpha=0.7)
         
         ax.set_xlabel('Energy (eV)')
@@ -63,7 +168,8 @@ class EndfPlotter:
         return fig, ax
     
     @staticmethod
-    def plot_multiple_cross_sections(material, mt_list, title=None, log_scale=True, show=True):
+    def plot_multiple_cross_sections(material, mt_list, title=None, log_scale=True, show=True,
+                                     ax=None, max_points=2000):
         """
         Plot multiple cross sections on the same graph.
         
@@ -73,12 +179,19 @@ class EndfPlotter:
             title (str): Plot title
             log_scale (bool): Whether to use logarithmic scales
             show (bool): Whether to show the plot immediately
+            ax (matplotlib.axes.Axes): Existing axes to plot into. A new figure
+                is created if None.
+            max_points (int): Longer curves are decimated to this many points.
+                All points are plotted if None.
             
         Returns:
             tuple: (fig, ax) matplotlib figure and axes objects
         """
-        # Create the plot
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Create the plot unless existing axes were given
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(10, 6))
+        else:
+            fig = ax.figure
         
         # Plot each cross section
         for mt in mt_list:
@@ -92,10 +205,14 @@ class EndfPlotter:
                     
                     # If sigma is a Tabulated1D object, get its x and y values
                     if hasattr(sigma, 'x') and hasattr(sigma, 'y'):
-                        if log_scale:
-                            ax.loglog(sigma.x, sigma.y, '-', lw=2, label=f"MT={mt} ({mt_desc})")
-                        else:
-                            ax.plot(sigma.x, sigma.y, '-', lw=2, label=f"MT={mt} ({mt_desc})")
+                        x_data, y_data = sigma.x, sigma.y
+                        if max_points is not None:
+                            x_data, y_data = EndfPlotter.decimate(
+                                np.asarray(x_data), np.asarray(y_data), max_points, log_scale
+                            )
+                        
+                        EndfPlotter._draw_line(ax, x_data, y_data, log_scale,
+                                               label=f"MT={mt} ({mt_desc})")
         
         ax.set_xlabel('Energy (eV)')
         ax.set_ylabel('Cross Section (barns)')
@@ -116,7 +233,7 @@ class EndfPlotter:
     
     @staticmethod
     def plot_general_data(x_data, y_data, title=None, xlabel=None, ylabel=None, 
-                          log_scale=True, show=True):
+                          log_scale=True, show=True, ax=None, prelog=False):
         """
         General purpose plotting function for any x,y data.
         
@@ -128,17 +245,27 @@ class EndfPlotter:
             ylabel (str): Y-axis label
             log_scale (bool): Whether to use logarithmic scales
             show (bool): Whether to show the plot immediately
+            ax (matplotlib.axes.Axes): Existing axes to plot into. A new figure
+                is created if None.
+            prelog (bool): For log scales, draw curves longer than 5000 points
+                from precomputed log10 values on linear axes labelled as powers
+                of ten, so redraws skip the per-point log transform. Such axes
+                cannot be switched with ``apply_scale``.
             
         Returns:
             tuple: (fig, ax) matplotlib figure and axes objects
         """
-        fig, ax = plt.subplots(figsize=(8, 6))
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(8, 6))
+        else:
+            fig = ax.figure
         
+        prelog = prelog and log_scale and len(x_data) > _PRELOG_THRESHOLD
+        EndfPlotter._draw_line(ax, x_data, y_data, log_scale, prelog,
+                               marker='.', markersize=4, markevery=_MARKER_SPACING)
         if log_scale:
-            ax.loglog(x_data, y_data, '-', lw=2, marker='.', markersize=4)
             ax.grid(True, which='both', linestyle='--', alpha=0.7)
         else:
-            ax.plot(x_data, y_data, '-', lw=2, marker='.', markersize=4)
             ax.grid(True, linestyle='--', alpha=0.7)
 
         if xlabel:
@@ -155,6 +282,70 @@ class EndfPlotter:
         
         return fig, ax
     
+    @staticmethod
+    def apply_scale(ax, log_scale=True):
+        """
+        Switch existing axes between logarithmic and linear scales.
+        
+        The plotted lines are left untouched; only the axis scales, the grid
+        and the view limits are updated.
+        
+        Args:
+            ax (matplotlib.axes.Axes): Axes to update
+            log_scale (bool): Whether to use logarithmic scales
+        """
+        scale = 'log' if log_scale else 'linear'
+        ax.set_xscale(scale)
+        ax.set_yscale(scale)
+        ax.grid(True, which='both' if log_scale else 'major', linestyle='--', alpha=0.7)
+        ax.autoscale()
+    
+    @staticmethod
+    def update_line(line, x_data, y_data):
+        """
+        Replace the data of a plotted line.
+        
+        The line is rasterized only if the new data is dense, like lines
+        added by the plot methods.
+        
+        Args:
+            line (matplotlib.lines.Line2D): Line to update
+            x_data (array): New x-axis data
+            y_data (array): New y-axis data
+        """
+        line.set_data(x_data, y_data)
+        line.set_rasterized(len(x_data) > _RASTERIZE_THRESHOLD)
+    
+    @staticmethod
+    def _draw_line(ax, x_data, y_data, log_scale, prelog=False, **style):
+        """
+        Add a line to the axes and set the axis scales.
+        
+        With prelog, the log-scale line is drawn from log10 data on linear
+        axes labelled as powers of ten.
+        """
+        if prelog:
+            x_data, y_data = EndfPlotter._prelog(np.asarray(x_data), np.asarray(y_data))
+            log_scale = False
+        
+        # Rasterizing keeps vector exports of dense curves to one image per line
+        rasterized = len(x_data) > _RASTERIZE_THRESHOLD
+        ax.plot(x_data, y_data, '-', lw=2, rasterized=rasterized, **style)
+        scale = 'log' if log_scale else 'linear'
+        ax.set_xscale(scale)
+        ax.set_yscale(scale)
+        
+        if prelog:
+            for axis in (ax.xaxis, ax.yaxis):
+                axis.set_major_locator(MaxNLocator(integer=True))
+                axis.set_major_formatter(FuncFormatter(lambda v, _: f"$10^{{{v:.0f}}}$"))
+    
+    @staticmethod
+    def _prelog(x, y):
+        """Take log10 of both coordinates, dropping points a log axis could not show."""
+        keep = (x > 0) & (y > 0)
+        return np.log10(x[keep]), np.log10(y[keep])
+    
     @staticmethod
     def close_plots():
         """Close all open matplotlib plots."""
@@ -163,20 +354,4 @@ class EndfPlotter:
     @staticmethod
     def _get_mt_description(mt):
         """Get description for an MT number."""
-        mt_descriptions = {
-            1: "Total cross section",
-            2: "Elastic scattering",
-            3: "Nonelastic cross section",
-            4: "Inelastic cross section",
-            5: "Sum of all reactions not given explicitly",
-            16: "(n,2n)",
-            17: "(n,3n)",
-            18: "Fission",
-            51: "Inelastic scattering to 1st excited state",
-            102: "Radiative capture (n,gamma)",
-            103: "(n,p)",
-            104: "(n,d)",
-            105: "(n,t)",
-            451: "File information and dictionary"
-        }
-        return mt_descriptions.get(mt, f"MT={mt}") 
\ No newline at end of file
+        return describe_mt(mt) 
\ No newline at end of file